@@ -1,50 +1,255 @@
 #!/usr/bin/env python
+import re
 import sys
+import json
+import asyncio
+import argparse
 import warnings
 import os
 
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-from src.research_daad.crew import ResearchDaad
-import src.utils.config as CONFIG
+# CrewAI, LangChain and Selenium are imported inside each command so that
+# commands which do not build a crew don't pay for them at startup
 # from dotenv import load_dotenv
 
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+MARKDOWN_MARKER = '[MARKDOWN]'
+CSV_MARKER = '[CSV]'
+# Output files are written through a 1 MiB buffer, 64 KiB of crew output at a time
+WRITE_BUFFER_SIZE = 1 << 20
+WRITE_CHUNK_SIZE = 1 << 16
+
+# Computed once per process and shared by every kickoff
+_CURRENT_YEAR = str(datetime.now().year)
+_BASE_INPUTS = {'topic': 'AI LLMs', 'current_year': _CURRENT_YEAR}
+
+OUTPUT_DIR = "output"
+
 # This main file is intended to be a way for you to run your
 # crew locally, so refrain from adding unnecessary logic into this file.
 # Replace with inputs you want to test with, it will automatically
 # interpolate any tasks and agents information
 
-def run():
+async def kickoff_concurrently(inputs_list, max_concurrency=None, return_exceptions=False):
     """
-    Run the crew.
+    Kick off one crew per input concurrently, bounded to respect provider rate limits.
+    Each input gets its own crew since a Crew instance holds per-run task state.
+    With `return_exceptions` a failed crew yields its exception in place of a
+    result instead of aborting the others.
     """
-    inputs = {
-        'topic': 'AI LLMs',
-        'current_year': str(datetime.now().year)
-    }
+    from src.research_daad.crew import ResearchDaad
+    from src.utils.config import settings
 
-    try:
-        researchDaad = ResearchDaad()
-        result = researchDaad.crew().kickoff()
-        # result = ResearchDaad().crew().kickoff(inputs=inputs)
+    if settings.llm_cache:
+        from src.utils.llm_handler import enable_litellm_cache
 
-        # Split markdown and CSV content
-        out_dir = "output"
-        os.makedirs(out_dir, exist_ok=True)
+        # Process-wide, so it is switched on here rather than by the handler
+        enable_litellm_cache()
+
+    if settings.prewarm_browser:
+        from src.research_daad.tools.daad_scraper_handler import prewarm_scraper
+
+        # Overlap Chrome startup with crew setup and the first LLM calls
+        prewarm_scraper()
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or settings.max_concurrency))
+
+    async def kickoff(inputs):
+        async with semaphore:
+            return await ResearchDaad().crew().kickoff_async(inputs=inputs)
+
+    return await asyncio.gather(*(kickoff(inputs) for inputs in inputs_list),
+                                return_exceptions=return_exceptions)
+
+def _slugify(text):
+    """Turn a topic into a file name stem."""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'crew'
+
+def _load_inputs(args):
+    """
+    Build the crew inputs from the command line: either one JSON file holding a
+    list of input dicts, or one topic per argument. Defaults to a single topic.
+    """
+    if len(args) == 1 and args[0].endswith('.json'):
+        inputs_list = json.loads(Path(args[0]).read_text())
+    else:
+        inputs_list = [{'topic': topic} for topic in args] or [{}]
+
+    return [dict(_BASE_INPUTS, **inputs) for inputs in inputs_list]
+
+def _strip_span(text, start, end):
+    """Narrow [start, end) to exclude surrounding whitespace without copying the text."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+def _split_result(result):
+    """
+    Locate the [MARKDOWN] and [CSV] markers once and return the (start, end)
+    span of each section. Anything after the first [CSV] that follows
+    [MARKDOWN] belongs to the CSV.
+    """
+    md_idx = result.find(MARKDOWN_MARKER)
+    if md_idx == -1:
+        return None
+
+    md_start = md_idx + len(MARKDOWN_MARKER)
+    csv_idx = result.find(CSV_MARKER, md_start)
+    if csv_idx == -1:
+        return None
+
+    return (_strip_span(result, md_start, csv_idx),
+            _strip_span(result, csv_idx + len(CSV_MARKER), len(result)))
+
+def _write_span(path, text, span):
+    """Stream one section of the crew output to disk in chunks through a large buffer."""
+    start, end = span
+    with open(path, 'w', buffering=WRITE_BUFFER_SIZE, newline='') as f:
+        for chunk_start in range(start, end, WRITE_CHUNK_SIZE):
+            f.write(text[chunk_start:min(chunk_start + WRITE_CHUNK_SIZE, end)])
+
+async def _save_output(result, stem, out_dir):
+    """
+    Write one crew result as its markdown file. The CSV is exported from the
+    cleaned data by the crew itself, so a [CSV] section the writer may still
+    emit is dropped rather than overwriting that export.
+    """
+    sections = _split_result(result)
+    md_span = sections[0] if sections else _strip_span(result, 0, len(result))
+    await asyncio.to_thread(_write_span, Path(out_dir, f'{stem}.md'), result, md_span)
 
-        if '[CSV]' in result and '[MARKDOWN]' in result:
-            md_content = result.split('[MARKDOWN]')[1].split('[CSV]')[0].strip()
-            csv_content = result.split('[CSV]')[1].strip()
+def _output_stems(inputs_list):
+    """Unique file name stem for each input's output files."""
+    if len(inputs_list) == 1:
+        return ['scholarships']
 
-            with open(f'{out_dir}/scholarships.md', 'w') as md_file:
-                md_file.write(md_content)
+    stems = []
+    seen = set()
+    for i, inputs in enumerate(inputs_list):
+        base = stem = _slugify(inputs.get('topic', str(i)))
+        # Topics that slugify alike (or repeat) must not overwrite each other's files
+        suffix = i
+        while stem in seen:
+            stem = f'{base}-{suffix}'
+            suffix += 1
+        seen.add(stem)
+        stems.append(stem)
+    return stems
 
-            with open(f'{out_dir}/scholarships.csv', 'w') as csv_file:
-                csv_file.write(csv_content)
+def _with_csv_paths(inputs_list, out_dir):
+    """Point each input's CSV export at its own file unless the input names one."""
+    return [
+        {'csv_path': str(Path(out_dir, f'{stem}.csv')), **inputs}
+        for inputs, stem in zip(inputs_list, _output_stems(inputs_list))
+    ]
+
+async def _save_outputs(results, inputs_list, out_dir):
+    """
+    Write the markdown and CSV files of every successful crew result in parallel,
+    then report the crews that failed.
+    """
+    failures = []
+    saves = []
+    for result, stem in zip(results, _output_stems(inputs_list)):
+        if isinstance(result, BaseException):
+            failures.append(f"{stem}: {result}")
+        else:
+            saves.append(_save_output(result, stem, out_dir))
+
+    await asyncio.gather(*saves)
+
+    if failures:
+        raise Exception(f"{len(failures)} of {len(results)} crews failed: " + "; ".join(failures))
+
+def _raw_results(crew_outputs):
+    """Keep the raw text of each crew output, passing failures through."""
+    return [
+        crew_output if isinstance(crew_output, BaseException) else crew_output.raw
+        for crew_output in crew_outputs
+    ]
+
+async def _run_all(inputs_list, out_dir):
+    """Kick off every crew, then write all of their outputs in parallel."""
+    crew_outputs = await kickoff_concurrently(inputs_list, return_exceptions=True)
+    await _save_outputs(_raw_results(crew_outputs), inputs_list, out_dir)
+
+def _kickoff_worker(inputs_chunk):
+    """
+    Run a share of the inputs concurrently in a worker process. Crews are
+    built inside the worker and only their raw text is sent back, so nothing
+    unpicklable crosses the process boundary; failures come back as a plain
+    RuntimeError describing them.
+    """
+    crew_outputs = asyncio.run(kickoff_concurrently(inputs_chunk, return_exceptions=True))
+    return [
+        RuntimeError(f"{type(result).__name__}: {result}") if isinstance(result, BaseException) else result
+        for result in _raw_results(crew_outputs)
+    ]
+
+def _kickoff_in_processes(inputs_list, processes):
+    """Spread the inputs round-robin over worker processes and return results in input order."""
+    processes = min(processes, len(inputs_list))
+    chunks = [inputs_list[i::processes] for i in range(processes)]
+    results = [None] * len(inputs_list)
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(_kickoff_worker, chunk) for chunk in chunks]
+        for worker, future in enumerate(futures):
+            try:
+                chunk_results = future.result()
+            except Exception as e:
+                # A crashed worker only loses its own share of the inputs
+                chunk_results = [e] * len(chunks[worker])
+            results[worker::processes] = chunk_results
+
+    return results
+
+def _parse_run_args(args):
+    """Split `run` arguments into topics (or a JSON inputs file) and the process count."""
+    parser = argparse.ArgumentParser(prog='run_crew')
+    parser.add_argument('topics', nargs='*', help="Topics to research, or one JSON file of input dicts")
+    parser.add_argument('--processes', type=int, default=1,
+                        help="Worker processes to spread the kickoffs over (default: 1, in-process). "
+                             "Each worker applies MAX_CONCURRENCY on its own, so up to "
+                             "processes x MAX_CONCURRENCY crews run at once")
+    return parser.parse_args(args)
+
+def run(inputs_list=None, processes=None):
+    """
+    Run the crew once per input. Inputs come from the command line when not given:
+    `run_crew "AI LLMs" "Robotics"` or `run_crew inputs.json`.
+    A single input writes output/scholarships.{md,csv}; several inputs write
+    output/{topic-slug}.{md,csv}. The CSV is written from the cleaned data
+    when each crew finishes.
+    With `--processes N` the kickoffs are spread over N worker processes, each
+    still running its share concurrently, for when orchestration becomes CPU-bound.
+    """
+    if inputs_list is None:
+        args = _parse_run_args(sys.argv[1:])
+        inputs_list = _load_inputs(args.topics)
+        processes = processes or args.processes
+
+    if not inputs_list:
+        print("No inputs to run.")
+        return
+
+    try:
+        out_dir = OUTPUT_DIR
+        os.makedirs(out_dir, exist_ok=True)
+        inputs_list = _with_csv_paths(inputs_list, out_dir)
+
+        if processes and processes > 1:
+            results = _kickoff_in_processes(inputs_list, processes)
+            asyncio.run(_save_outputs(results, inputs_list, out_dir))
+        else:
+            asyncio.run(_run_all(inputs_list, out_dir))
     except Exception as e:
         raise Exception(f"An error occurred while running the crew: {e}")
 
@@ -52,10 +257,9 @@ def train():
     """
     Train the crew for a given number of iterations.
     """
-    inputs = {
-        "topic": "AI LLMs",
-        'current_year': str(datetime.now().year)
-    }
+    from src.research_daad.crew import ResearchDaad
+
+    inputs = dict(_BASE_INPUTS, csv_path=f'{OUTPUT_DIR}/scholarships.csv')
     try:
         ResearchDaad().crew().train(n_iterations=int(sys.argv[1]), filename=sys.argv[2], inputs=inputs)
 
@@ -66,6 +270,8 @@ def replay():
     """
     Replay the crew execution from a specific task.
     """
+    from src.research_daad.crew import ResearchDaad
+
     try:
         ResearchDaad().crew().replay(task_id=sys.argv[1])
 
@@ -76,10 +282,9 @@ def test():
     """
     Test the crew execution and returns the results.
     """
-    inputs = {
-        "topic": "AI LLMs",
-        "current_year": str(datetime.now().year)
-    }
+    from src.research_daad.crew import ResearchDaad
+
+    inputs = dict(_BASE_INPUTS, csv_path=f'{OUTPUT_DIR}/scholarships.csv')
 
     try:
         ResearchDaad().crew().test(n_iterations=int(sys.argv[1]), eval_llm=sys.argv[2], inputs=inputs)
@@ -1,18 +1,66 @@
 import os
+import logging
+import functools
 from crewai import Agent, Crew, Process, Task
-from crewai.project import CrewBase, agent, crew, task
+from crewai.project import CrewBase, agent, crew, task, before_kickoff, after_kickoff
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from src.research_daad.tools.daad_scraper_handler import scrape_daad_scholarships
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.utils.llm_handler import LLMHandler
-import src.utils.config as CONFIG
+from src.utils.csv_writer import parse_json_records, write_records_csv
+from src.utils.config import settings
 
 # If you want to run a snippet of code before or after the crew starts,
 # you can use the @before_kickoff and @after_kickoff decorators
 # https://docs.crewai.com/concepts/crews#example-crew-class-with-decorators
 
 
+@functools.lru_cache(maxsize=8)
+def _build_handler(config_items: Tuple[Tuple[str, Any], ...]) -> LLMHandler:
+    """Build the LLM handler once per distinct configuration and share it across crews."""
+    return LLMHandler.from_config(dict(config_items))
+
+
+@functools.lru_cache(maxsize=8)
+def _build_llm(config_items: Tuple[Tuple[str, Any], ...]):
+    """Build the LLM instance once per distinct configuration and share it across crews."""
+    return _build_handler(config_items).get_llm()
+
+
+def _freeze_config(config: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Normalize an LLM configuration into a hashable cache key."""
+    return tuple(sorted(config.items()))
+
+
+def _cache_key(config: Dict[str, Any]) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """
+    Cache key for a configuration, or None when it holds unhashable values
+    (e.g. `model_kwargs={...}` or `stop=[...]`) and must be built uncached.
+    """
+    config_items = _freeze_config(config)
+    try:
+        hash(config_items)
+    except TypeError:
+        return None
+    return config_items
+
+
+def _get_handler(config: Dict[str, Any]) -> LLMHandler:
+    """Return the shared handler for a configuration, building it fresh if it can't be cached."""
+    config_items = _cache_key(config)
+    if config_items is None:
+        return LLMHandler.from_config(dict(config))
+    return _build_handler(config_items)
+
+
+def _get_llm(config: Dict[str, Any], handler: LLMHandler):
+    """Return the shared LLM for a configuration, building it from `handler` if it can't be cached."""
+    config_items = _cache_key(config)
+    if config_items is None:
+        return handler.get_llm()
+    return _build_llm(config_items)
+
 
 @CrewBase
 class ResearchDaad():
@@ -43,19 +91,20 @@ class ResearchDaad():
         """
         super().__init__()
         self.llm_config = llm_config or self._get_default_llm_config()
-        self.llm_handler = LLMHandler.from_config(self.llm_config.copy())
-        self.llm = self.llm_handler.get_llm()
+        self.llm_handler = _get_handler(self.llm_config)
+        self.llm = _get_llm(self.llm_config, self.llm_handler)
+        self.csv_path: Optional[str] = None
 
     def _get_default_llm_config(self) -> Dict[str, Any]:
         """Get default LLM configuration from environment or use OpenAI as fallback."""
         # Check for environment variables to set default provider
-        provider = CONFIG.DEFAULT_LLM_PROVIDER
-        model = CONFIG.DEFAULT_LLM_MODEL
+        provider = settings.default_llm_provider
+        model = settings.default_llm_model
 
         config = {
             'provider': provider,
-            'temperature': CONFIG.LLM_TEMPERATURE,
-            'max_tokens': CONFIG.LLM_MAX_TOKENS
+            'temperature': settings.llm_temperature,
+            'max_tokens': settings.llm_max_tokens
         }
 
         if model:
@@ -70,7 +119,7 @@ class ResearchDaad():
     def update_llm_config(self, new_config: Dict[str, Any]):
         """Update LLM configuration and recreate handler."""
         self.llm_config.update(new_config)
-        self.llm_handler = LLMHandler.from_config(self.llm_config.copy())
+        self.llm_handler = _get_handler(self.llm_config)
 
     @agent
     def scraper(self) -> Agent:
@@ -121,9 +170,29 @@ class ResearchDaad():
     def writer_task(self) -> Task:
         return Task(
             config=self.tasks_config['write_task'],
-            output_file='scholarships.md'
         )
 
+    @before_kickoff
+    def remember_csv_path(self, inputs: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Note where this run's CSV goes; the writer agent only produces markdown"""
+        self.csv_path = (inputs or {}).get('csv_path')
+        return inputs
+
+    @after_kickoff
+    def write_csv(self, result):
+        """Write the cleaner's records straight to CSV instead of having an LLM re-emit every row"""
+        cleaner_output = self.cleaner_task().output
+        if not self.csv_path or cleaner_output is None:
+            return result
+
+        records = parse_json_records(cleaner_output.raw)
+        if records is None:
+            logging.getLogger(__name__).warning("Cleaned data is not a JSON list; no CSV written")
+            return result
+
+        write_records_csv(records, self.csv_path)
+        return result
+
     @crew
     def crew(self) -> Crew:
         """Creates the ResearchDaad crew"""
@@ -1,32 +1,394 @@
-import json
+import os
+import re
+import queue
+import shutil
+import tempfile
+import atexit
+import asyncio
 import time
 import logging
-from urllib.parse import urljoin
-from typing import List, Dict, Optional
-
-from bs4 import BeautifulSoup, Tag
+import threading
+from functools import lru_cache
+from pathlib import Path
+from contextlib import asynccontextmanager, contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urljoin, urlparse
+from typing import IO, Any, AsyncIterator, Coroutine, Iterator, List, Dict, Optional, Tuple, TypeVar
+
+import httpx
+import orjson
+import diskcache
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.driver_finder import DriverFinder
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
-import src.utils.config as CONFIG
+from src.utils.config import settings
+
+T = TypeVar('T')
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp",
+    "*.css", "*.woff*", "*.ttf", "*.mp4"
+]
+# Trailing " • DAAD" / " · DAAD" suffix on result titles
+TITLE_SUFFIX_PATTERN = re.compile(r'\s*[\u2022\u00b7]\s*DAAD\s*$')
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry transport failures, rate limiting and server errors, not client errors"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+# Selectors are defined once and shared by every page parse
+RESULT_ENTRY_SELECTOR = "ul.resultlist > li.entry"
+RESULT_LINK_SELECTOR = "h2 a"
+PAGINATION_LINK_SELECTOR = "a.pagination__last, .pagination a[href*='page=']"
+DETAIL_CONTAINER_SELECTOR = "#ifa-stipendien-detail"
+ELIGIBILITY_FORM_SELECTOR = "#select-application-info-form"
+# Pane behind the "Application requirements" tab (li#bewerbungsvoraussetzungen)
+REQUIREMENTS_CONTENT_SELECTOR = "div#voraussetzungen h3"
+SUBMIT_ELIGIBILITY_FORM_SCRIPT = """
+const selected = [];
+document.querySelectorAll('#select-application-info-form select').forEach(sel => {
+    const opt = [...sel.options].find(o => o.value.trim());
+    if (opt) {
+        sel.value = opt.value;
+        sel.dispatchEvent(new Event('change', {bubbles: true}));
+        selected.push(opt.text);
+    }
+});
+const submit = document.getElementById('stipdb-submit-detail');
+if (submit) {
+    submit.click();
+}
+return selected;
+"""
+SECTION_SELECTORS = tuple(
+    f"div#{section_id}"
+    for section_id in ('ueberblick', 'voraussetzungen', 'prozess', 'kontaktberatung', 'bewerbung')
+)
+H3_TAG = 'h3'
+TEXT_TAGS = frozenset({'p', 'ul', 'ol'})
+# Every section plus its direct h3/text children, matched in one query and
+# returned in document order, so a page is extracted in a single walk
+SECTION_CONTENT_SELECTOR = ", ".join(
+    ", ".join([section] + [f"{section} > {tag}" for tag in (H3_TAG, *sorted(TEXT_TAGS))])
+    for section in SECTION_SELECTORS
+)
+
+
+@lru_cache(maxsize=1)
+def _resolve_driver_paths() -> Tuple[str, str]:
+    """
+    Resolve the chromedriver and Chrome binaries once per process. Uses the
+    CHROMEDRIVER/CHROME_BIN paths baked into the image when set, otherwise asks
+    Selenium Manager a single time instead of on every driver launch.
+    """
+    if settings.chromedriver:
+        return settings.chromedriver, settings.chrome_bin
+
+    finder = DriverFinder(Service(), Options())
+    return finder.get_driver_path(), finder.get_browser_path()
+
+
+def create_driver(headless: bool = True, user_data_dir: Optional[str] = None) -> webdriver.Chrome:
+    """Setup Chrome driver with optimized options"""
+    chrome_options = Options()
+
+    # Performance and stability options
+    options_list = [
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--window-size=1920,1080",
+        f"--user-agent={USER_AGENT}",
+        "--disable-blink-features=AutomationControlled",
+        "--disable-extensions",
+        "--disable-plugins",
+        "--blink-settings=imagesEnabled=false",
+        # Background services and renderer subsystems the scraper never uses
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-translate",
+        "--disable-default-apps",
+        "--disable-features=Translate,BackForwardCache,IsolateOrigins,site-per-process,"
+        "AutofillServerCommunication,MediaRouter,OptimizationHints",
+        "--metrics-recording-only",
+        "--mute-audio",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-hang-monitor",
+        "--disable-client-side-phishing-detection",
+        "--disable-component-update",
+        "--disable-ipc-flooding-protection",
+        "--disable-renderer-backgrounding",
+        "--disable-backgrounding-occluded-windows",
+        "--js-flags=--max-old-space-size=256"
+    ]
+
+    if headless:
+        options_list.append("--headless")
+
+    if user_data_dir:
+        options_list.append(f"--user-data-dir={user_data_dir}")
+
+    for option in options_list:
+        chrome_options.add_argument(option)
+
+    # Return from get() immediately; callers wait for the elements they need
+    # and then stop the remaining trackers, fonts and third-party scripts
+    chrome_options.page_load_strategy = "none"
+
+    driver_path, browser_path = _resolve_driver_paths()
+    if browser_path:
+        chrome_options.binary_location = browser_path
+    service = Service(executable_path=driver_path)
+
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+
+    # Block images, stylesheets, fonts and media at the network layer
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS})
+    return driver
+
+
+class DriverPool:
+    """
+    Thread-safe pool of Chrome drivers shared by every scraper in the process.
+
+    Drivers are started lazily up to `size` and handed out to one caller at a
+    time, so fallback renders run in parallel while each browser is launched
+    only once. A driver is quit and its temporary profile deleted after
+    `max_pages_per_driver` pages, keeping Chrome's memory from growing over
+    long crawls; the next caller starts a fresh one in its slot.
+    """
+
+    def __init__(self, headless: bool = True, size: int = 4, max_pages_per_driver: int = 25):
+        self.headless = headless
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._started = 0
+        self._pages: Dict[webdriver.Chrome, int] = {}
+        self._profiles: Dict[webdriver.Chrome, str] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self) -> Iterator[webdriver.Chrome]:
+        """Borrow a driver, starting a new one while the pool is not full"""
+        driver = self._checkout()
+        try:
+            yield driver
+        except BaseException:
+            # Expected timeouts are handled by the callers, so anything that
+            # escapes means the driver is broken; don't hand it out again
+            self._quit_driver(driver)
+            raise
+        self._checkin(driver)
+
+    def prewarm(self) -> None:
+        """Start one driver ahead of demand so the first fallback render doesn't wait on Chrome"""
+        with self._lock:
+            if self._started >= self.size:
+                return
+            self._started += 1
+
+        self._idle.put(self._start_driver())
+
+    def _checkout(self) -> webdriver.Chrome:
+        """Take an idle driver, start one if a slot is free, else wait"""
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                start_new = self._started < self.size
+                if start_new:
+                    # Reserve the slot before the slow browser launch
+                    self._started += 1
+
+            if start_new:
+                return self._start_driver()
+
+            # Re-check periodically, a recycled driver frees its slot
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue
+
+    def _checkin(self, driver: webdriver.Chrome) -> None:
+        """Return a driver to the pool, recycling it once it hits the page cap"""
+        with self._lock:
+            self._pages[driver] += 1
+            recycle = self._pages[driver] >= self.max_pages_per_driver
+
+        if recycle:
+            self._quit_driver(driver)
+        else:
+            self._idle.put(driver)
+
+    def _start_driver(self) -> webdriver.Chrome:
+        """Launch a driver with its own temporary profile in a reserved slot"""
+        profile_dir = tempfile.mkdtemp(prefix=f"daad-chrome-{os.getpid()}-")
+        try:
+            driver = create_driver(self.headless, user_data_dir=profile_dir)
+        except Exception:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            with self._lock:
+                self._started -= 1
+            raise
+
+        with self._lock:
+            self._pages[driver] = 0
+            self._profiles[driver] = profile_dir
+        return driver
+
+    def _quit_driver(self, driver: webdriver.Chrome) -> None:
+        """Quit a driver, purge its profile and free its slot"""
+        with self._lock:
+            self._pages.pop(driver, None)
+            profile_dir = self._profiles.pop(driver, None)
+            self._started -= 1
+
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+    def close(self) -> None:
+        """Quit every driver started by the pool"""
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+        with self._lock:
+            drivers = list(self._profiles)
+
+        for driver in drivers:
+            self._quit_driver(driver)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every scraper and event loop in the process.
+
+    A thread lock guards the bucket instead of an asyncio primitive, so crews
+    kicked off concurrently, each scraping on its own event loop in a worker
+    thread, draw from one budget. Separate processes each have their own.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        # Allow a burst of up to one second's worth of requests
+        self.capacity = max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, only sleeping when over the ceiling"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter(requests_per_second: float) -> RateLimiter:
+    """Return the process-wide limiter for this request rate"""
+    return RateLimiter(requests_per_second)
+
+
+@lru_cache(maxsize=None)
+def get_driver_pool(headless: bool = True) -> DriverPool:
+    """Return the process-wide driver pool, closed at interpreter exit"""
+    pool = DriverPool(headless=headless)
+    atexit.register(pool.close)
+    return pool
+
+
+def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run `coro` to completion, off-thread if this thread already runs an event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
 
 
 class DAADScholarshipScraper:
     """Web scraper for DAAD scholarship database"""
 
-    def __init__(self, headless: bool = True):
-        """Initialize the scraper with Chrome driver"""
+    def __init__(self, headless: bool = True, concurrency: int = 16,
+                 driver_pool: Optional[DriverPool] = None,
+                 output_file: Optional[str] = None,
+                 requests_per_second: float = 5,
+                 html_cache_dir: Optional[str] = settings.html_cache_dir):
+        """
+        Initialize the scraper.
+
+        Pages are fetched over a pooled async HTTP client; Chrome is only
+        started on demand for pages that cannot be extracted from the raw HTML.
+
+        Args:
+            headless: Run the fallback Chrome drivers without a window
+            concurrency: Maximum number of detail pages fetched in parallel
+            driver_pool: Externally managed driver pool; defaults to the
+                process-wide pool for `headless`
+            output_file: JSON Lines file that scholarships are appended to as
+                they are extracted while the scraper is used as a context
+                manager; they are then not kept in `self.scholarships`
+            requests_per_second: Ceiling on the HTTP request rate to DAAD,
+                shared by every scraper in this process; each worker process
+                started with `--processes` applies its own ceiling
+            html_cache_dir: Directory of the on-disk page cache that is
+                revalidated with conditional GETs; None disables it
+        """
         self.base_url = "https://www2.daad.de"
         self.search_url = "https://www2.daad.de/deutschland/stipendium/datenbank/en/21148-scholarship-database/"
         self.scholarships = []
-        self.driver = None
+        self.headless = headless
+        self.concurrency = concurrency
+        self.driver_pool = driver_pool or get_driver_pool(headless)
+        self.requests_per_second = requests_per_second
+        self.client: Optional[httpx.AsyncClient] = None
+        self._limiter = get_rate_limiter(requests_per_second)
+        self.html_cache_dir = html_cache_dir
+        self._html_cache: Optional[diskcache.Cache] = None
+        self.output_file = output_file
+        self._out: Optional[IO[bytes]] = None
+        # Set once `output_file` has been opened, i.e. records went there
+        self._streamed = False
         self.logger = self._setup_logging()
-        self.setup_driver(headless)
         self.scholarship_links = {}
 
     def _setup_logging(self) -> logging.Logger:
@@ -37,68 +399,114 @@ class DAADScholarshipScraper:
         )
         return logging.getLogger(__name__)
 
-    def setup_driver(self, headless: bool = True) -> None:
-        """Setup Chrome driver with optimized options"""
-        chrome_options = Options()
-
-        # Performance and stability options
-        options_list = [
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-            "--disable-gpu",
-            "--window-size=1920,1080",
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "--disable-blink-features=AutomationControlled",
-            "--disable-extensions",
-            "--disable-plugins",
-            "--blink-settings=imagesEnabled=false"
-        ]
-
-        if headless:
-            options_list.append("--headless")
-
-        for option in options_list:
-            chrome_options.add_argument(option)
-
-        if CONFIG.RUNNING_IN_DOCKER:
-            # Point to Chromium binary explicitly (Debian path)
-            chrome_options.binary_location = "/usr/bin/chromium"
-            # Provide the system chromedriver path ***
-            service = Service(executable_path="/usr/bin/chromedriver")
-            # Let Selenium 4.34.2 manage the right chromedriver automatically
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        else:
-            self.driver = webdriver.Chrome(options=chrome_options)
+    @asynccontextmanager
+    async def _http_client(self):
+        """Open the pooled HTTP/2 client used for the duration of a scrape"""
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=20,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+        ) as client:
+            self.client = client
+            if self.html_cache_dir:
+                self._html_cache = diskcache.Cache(self.html_cache_dir)
+            try:
+                yield client
+            finally:
+                self.client = None
+                if self._html_cache is not None:
+                    self._html_cache.close()
+                    self._html_cache = None
+
+    async def fetch(self, url: str, params: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """
+        Fetch a page over the shared HTTP client, backing off on 429/5xx responses.
 
+        Pages served with an ETag or Last-Modified header are kept in the HTML
+        cache keyed by URL and revalidated with a conditional GET, so unchanged
+        pages come back as a body-less 304.
+        """
+        request = self.client.build_request("GET", url, params=params)
+        cache_key = str(request.url)
+        cached = self._html_cache.get(cache_key) if self._html_cache is not None else None
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                request.headers["If-None-Match"] = etag
+            if last_modified:
+                request.headers["If-Modified-Since"] = last_modified
 
-        self.driver.implicitly_wait(10)
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(5),
+                wait=wait_exponential(min=1, max=60),
+                retry=retry_if_exception(_is_retryable),
+                reraise=True,
+            ):
+                with attempt:
+                    async with self._limiter:
+                        response = await self.client.send(request)
+                    if cached and response.status_code == 304:
+                        return cached[2]
+                    response.raise_for_status()
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if self._html_cache is not None:
+                if etag or last_modified:
+                    self._html_cache.set(cache_key, (etag, last_modified, response.text))
+                elif cached:
+                    # Without validators the old entry is stale and can't be revalidated
+                    self._html_cache.delete(cache_key)
+            return response.text
+
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error fetching {url}: {e}")
+            return None
 
-    def _handle_cookie_popup(self) -> None:
+    def _stop_loading_subresources(self, driver: webdriver.Chrome, timeout: float = 10) -> None:
+        """
+        Stop remaining trackers and scripts once the document is fully parsed.
+        Stopping while it is still streaming would truncate the DOM, so the
+        load is left to run if parsing does not finish within `timeout`.
+        """
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState") != "loading"
+            )
+        except TimeoutException:
+            self.logger.warning("Document still parsing; not stopping page load")
+            return
+        driver.execute_script("window.stop();")
+
+    def _handle_cookie_popup(self, driver: webdriver.Chrome) -> None:
         """Handle cookie consent popup if present"""
         try:
             # Wait for the modal to appear (shorter timeout)
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located(
                     (By.CLASS_NAME, "snoop-modal")
                 )
             )
 
             # Look for the specific "Accept" button with the qa class
-            accept_button = WebDriverWait(self.driver, 5).until(
+            accept_button = WebDriverWait(driver, 5).until(
                 EC.element_to_be_clickable(
                     (By.CLASS_NAME, "qa-cookie-consent-accept-all")
                 )
             )
 
             # Scroll into view if needed
-            self.driver.execute_script("arguments[0].scrollIntoView();", accept_button)
+            driver.execute_script("arguments[0].scrollIntoView();", accept_button)
 
             # Click the button
             accept_button.click()
             self.logger.info("Cookie consent accepted")
 
             # Wait for modal to disappear (short wait)
-            WebDriverWait(self.driver, 5).until(
+            WebDriverWait(driver, 5).until(
                 EC.invisibility_of_element_located((By.CLASS_NAME, "snoop-modal"))
             )
 
@@ -107,153 +515,267 @@ class DAADScholarshipScraper:
         except Exception as e:
             self.logger.warning(f"Error handling cookie popup: {e}")
 
-    def get_page_source(self, url: str) -> Optional[str]:
-        """Get page source using Selenium with error handling"""
-        try:
-            self.driver.get(url)
-            self._handle_cookie_popup()
+    async def get_results_page(self, url: str) -> Optional[LexborHTMLParser]:
+        """Get a parsed search results page, falling back to Selenium if it has no entries"""
+        page_source = await self.fetch(url)
+        tree = LexborHTMLParser(page_source) if page_source else None
+        if tree and tree.css_first(RESULT_ENTRY_SELECTOR):
+            return tree
 
-            # Wait for search results to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "ul.resultlist > li.entry")
-                )
-            )
-            time.sleep(2)  # Allow dynamic content to load
-            return self.driver.page_source
-
-        except TimeoutException:
-            self.logger.error(f"Timeout loading page: {url}")
-            return None
+        self.logger.info(f"No results in raw HTML, rendering with Selenium: {url}")
+        page_source = await asyncio.to_thread(self._render_page_source, url)
+        return LexborHTMLParser(page_source) if page_source else None
 
+    def _render_page_source(self, url: str) -> Optional[str]:
+        """Get page source using Selenium with error handling"""
+        with self.driver_pool.acquire() as driver:
+            try:
+                driver.get(url)
+                self._handle_cookie_popup(driver)
+
+                # Wait for search results to load
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, RESULT_ENTRY_SELECTOR)
+                    )
+                )
+                self._stop_loading_subresources(driver)
+                return driver.page_source
 
-    def navigate_to_next_page(self) -> Optional[str]:
-        """Navigate to the next page if available"""
-        try:
-            next_button = self.driver.find_element(By.XPATH, "//a[contains(text(), '›')]")
-            if 'disabled' not in next_button.get_attribute('class'):
-                next_button.click()
-                return True
-        except Exception:
-            pass
-        return False
+            except TimeoutException:
+                self.logger.error(f"Timeout loading page: {url}")
+                return None
 
-    def extract_scholarship_links(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _listing_url(self, page: int) -> str:
+        """Build the search results URL for a given page"""
+        return f"{self.search_url}?status=&origin=&subjectGrps=&daad=&intention=&q=&page={page}&back=1"
+
+    def _last_page_number(self, tree: LexborHTMLParser) -> Optional[int]:
+        """Read the last results page number from the pagination links, if any"""
+        pages = []
+        for link in tree.css(PAGINATION_LINK_SELECTOR):
+            page = parse_qs(urlparse(link.attributes.get('href') or '').query).get('page')
+            if page and page[0].isdigit():
+                pages.append(int(page[0]))
+        return max(pages) if pages else None
+
+    async def _iter_listing_pages(self, first_page: LexborHTMLParser,
+                                  max_pages: Optional[int] = None) -> AsyncIterator[Tuple[int, LexborHTMLParser]]:
         """
-        The function `extract_scholarship_links` parses a BeautifulSoup object to
-        extract scholarship links from a search results page and returns them in a
-        list of dictionaries containing the URL and title of each scholarship.
-
-        :param soup: The `soup` parameter in the `extract_scholarship_links` method
-        is expected to be an instance of the BeautifulSoup class. BeautifulSoup is a
-        Python library for pulling data out of HTML and XML files. In this context,
-        the `soup` parameter is used to represent the parsed HTML content of
-        :type soup: BeautifulSoup
-        :return: A list of dictionaries containing the extracted scholarship links,
-        where each dictionary has keys 'url' and 'title' corresponding to the URL
-        and title of the scholarship respectively.
+        Yield `(page_number, tree)` for the results pages after the first one,
+        up to `max_pages` pages in total. When the first page tells how many
+        pages there are, they are fetched concurrently and yielded as each one
+        arrives, so callers that need page order sort by the page number.
         """
-        """Extract scholarship links from search results page"""
+        last_page = self._last_page_number(first_page)
+
+        if last_page is None:
+            # No pagination links: walk pages until one comes back empty
+            page = 2
+            while not max_pages or page <= max_pages:
+                page_source = await self.fetch(self._listing_url(page))
+                tree = LexborHTMLParser(page_source) if page_source else None
+                if not tree or not tree.css_first(RESULT_ENTRY_SELECTOR):
+                    return
+                yield page, tree
+                page += 1
+            return
+
+        if max_pages:
+            last_page = min(last_page, max_pages)
+        semaphore = asyncio.Semaphore(8)
+
+        async def fetch_page(page: int) -> Tuple[int, Optional[LexborHTMLParser]]:
+            async with semaphore:
+                page_source = await self.fetch(self._listing_url(page))
+            return page, LexborHTMLParser(page_source) if page_source else None
+
+        for next_page in asyncio.as_completed([fetch_page(page) for page in range(2, last_page + 1)]):
+            page, tree = await next_page
+            if tree:
+                yield page, tree
+
+    def extract_scholarship_links(self, tree: LexborHTMLParser) -> List[Dict[str, str]]:
+        """
+        The function `extract_scholarship_links` parses a search results page and
+        collects the URL and title of each scholarship into `self.scholarship_links`.
 
-        results = soup.select('ul.resultlist > li.entry')
+        :param tree: The parsed HTML of a search results page
+        :type tree: LexborHTMLParser
+        :return: A list of dictionaries with the 'url' and 'title' of every
+        scholarship found on the page
+        """
+        links = []
+        results = tree.css(RESULT_ENTRY_SELECTOR)
 
         for result in results:
             try:
-                link_tag = result.find('h2').find('a')
-                if link_tag and link_tag.get('href'):
-                    full_url = urljoin(self.base_url, link_tag['href'])
-                    title = link_tag.get_text(strip=True).replace('\xa0• DAAD', '')
-                    self.scholarship_links[full_url] = {
+                link_tag = result.css_first(RESULT_LINK_SELECTOR)
+                href = link_tag.attributes.get('href') if link_tag else None
+                if href:
+                    full_url = urljoin(self.base_url, href)
+                    title = TITLE_SUFFIX_PATTERN.sub('', link_tag.text(strip=True))
+                    link_data = {
                         'url': full_url,
                         'title': title
                     }
+                    self.scholarship_links[full_url] = link_data
+                    links.append(link_data)
             except Exception as e:
                 self.logger.warning(f"Error extracting link: {e}")
                 continue
 
-    def _click_application_requirements_tab(self) -> None:
+        return links
+
+    def _click_application_requirements_tab(self, driver: webdriver.Chrome) -> None:
         """Click on application requirements tab and handle form if present"""
         try:
-            tab_link = WebDriverWait(self.driver, 10).until(
+            tab_link = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable(
                     (By.CSS_SELECTOR, "li#bewerbungsvoraussetzungen > a")
                 )
             )
-            self.driver.execute_script("arguments[0].click();", tab_link)
+            driver.execute_script("arguments[0].click();", tab_link)
             self.logger.info("Clicked on 'Application requirements' tab")
 
             # Handle eligibility form if present
-            self._handle_eligibility_form()
+            self._handle_eligibility_form(driver)
 
         except TimeoutException:
             self.logger.warning("Could not find application requirements tab")
 
-    def _handle_eligibility_form(self) -> None:
+    def _handle_eligibility_form(self, driver: webdriver.Chrome) -> None:
         """Handle eligibility form by selecting first valid option in each dropdown"""
         try:
-            WebDriverWait(self.driver, 5).until(
+            WebDriverWait(driver, 5).until(
                 EC.presence_of_element_located((By.ID, "select-application-info-form"))
             )
             self.logger.info("Eligibility form detected. Submitting form...")
 
-            # Select first non-empty option from each dropdown
-            selects = self.driver.find_elements(
-                By.CSS_SELECTOR, "#select-application-info-form select"
-            )
-
-            for select_elem in selects:
-                options = select_elem.find_elements(By.TAG_NAME, "option")
-                for option in options:
-                    if option.get_attribute("value").strip():
-                        self.driver.execute_script("arguments[0].selected = true;", option)
-                        self.driver.execute_script(
-                            "arguments[0].dispatchEvent(new Event('change'))",
-                            select_elem
-                        )
-                        self.logger.info(f"Selected option: {option.text}")
-                        break
-
-            time.sleep(1)
-
-            # Submit form
-            submit_button = self.driver.find_element(By.ID, "stipdb-submit-detail")
-            self.driver.execute_script("arguments[0].click();", submit_button)
+            # Select the first non-empty option of every dropdown and submit the
+            # form in one in-page script instead of a command per option
+            selected = driver.execute_script(SUBMIT_ELIGIBILITY_FORM_SCRIPT)
+            for option_text in selected:
+                self.logger.info(f"Selected option: {option_text}")
             self.logger.info("Form submitted successfully")
-            time.sleep(2)
 
         except TimeoutException:
             self.logger.info("No eligibility form detected")
+            return
 
-    def get_scholarship_details_page(self, url: str) -> Optional[str]:
-        """Load scholarship details page and handle interactive elements"""
         try:
-            self.driver.get(url)
-
-            # Wait for main content to load
-            WebDriverWait(self.driver, 20).until(
-                EC.presence_of_element_located((By.ID, "ifa-stipendien-detail"))
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, REQUIREMENTS_CONTENT_SELECTOR))
             )
+        except TimeoutException:
+            self.logger.warning("Application requirements did not load after submitting the form")
 
-            # Click application requirements tab
-            self._click_application_requirements_tab()
+    def _eligibility_form_request(self, form: LexborNode, url: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Build the GET request the eligibility form submits, choosing the first
+        valid option of each dropdown like the interactive flow does.
+        """
+        params = {}
+        for field in form.css('input[type="hidden"]'):
+            name = field.attributes.get('name')
+            if name:
+                params[name] = field.attributes.get('value') or ''
+
+        for select_elem in form.css('select'):
+            name = select_elem.attributes.get('name')
+            if not name:
+                continue
+            for option in select_elem.css('option'):
+                value = (option.attributes.get('value') or '').strip()
+                if value:
+                    params[name] = value
+                    self.logger.info(f"Selected option: {option.text(strip=True)}")
+                    break
 
-            return self.driver.page_source
+        # A named submit button is sent along like a browser would
+        submit = form.css_first('button[type="submit"][name], input[type="submit"][name]')
+        if submit:
+            params[submit.attributes['name']] = submit.attributes.get('value') or ''
 
-        except TimeoutException:
-            self.logger.error(f"Timeout loading scholarship page: {url}")
-            return None
+        action = form.attributes.get('action')
+        return urljoin(url, action) if action else url, params
+
+    async def get_scholarship_details_page(self, url: str) -> Optional[LexborHTMLParser]:
+        """Load and parse scholarship details page, submitting the eligibility form if present"""
+        page_source = await self.fetch(url)
+        tree = LexborHTMLParser(page_source) if page_source else None
+
+        if not tree or not tree.css_first(DETAIL_CONTAINER_SELECTOR):
+            self.logger.info(f"Details not in raw HTML, rendering with Selenium: {url}")
+            page_source = await asyncio.to_thread(self._render_scholarship_details_page, url)
+            return LexborHTMLParser(page_source) if page_source else None
+
+        # Requirements are usually already in the initial HTML; only pages
+        # where they are missing need the form submitted or the tab clicked
+        if tree.css_first(REQUIREMENTS_CONTENT_SELECTOR):
+            return tree
+
+        form = tree.css_first(ELIGIBILITY_FORM_SELECTOR)
+        if form:
+            self.logger.info("Eligibility form detected. Submitting form...")
+            method = (form.attributes.get('method') or 'get').strip().lower()
+            if method == 'get':
+                form_url, params = self._eligibility_form_request(form, url)
+                submitted = await self.fetch(form_url, params=params)
+                submitted_tree = LexborHTMLParser(submitted) if submitted else None
+                if self._has_requirements(submitted_tree):
+                    return submitted_tree
+
+        # No usable form response: click the tab and submit the form in the browser
+        self.logger.info(f"Requirements not in raw HTML, rendering with Selenium: {url}")
+        page_source = await asyncio.to_thread(self._render_scholarship_details_page, url)
+        rendered_tree = LexborHTMLParser(page_source) if page_source else None
+        if rendered_tree and rendered_tree.css_first(DETAIL_CONTAINER_SELECTOR):
+            return rendered_tree
+
+        return tree
+
+    @staticmethod
+    def _has_requirements(tree: Optional[LexborHTMLParser]) -> bool:
+        """Whether a parsed page holds the details container and its requirements content"""
+        return bool(tree
+                    and tree.css_first(DETAIL_CONTAINER_SELECTOR)
+                    and tree.css_first(REQUIREMENTS_CONTENT_SELECTOR))
+
+    def _render_scholarship_details_page(self, url: str) -> Optional[str]:
+        """Load scholarship details page and handle interactive elements"""
+        with self.driver_pool.acquire() as driver:
+            try:
+                driver.get(url)
+
+                # Wait for main content to load
+                WebDriverWait(driver, 20).until(
+                    EC.presence_of_element_located((By.ID, "ifa-stipendien-detail"))
+                )
 
-    def extract_scholarship_details(self, url: str, title: str) -> Optional[Dict]:
+                # Click application requirements tab only when its content is form-gated
+                if driver.find_elements(By.CSS_SELECTOR, REQUIREMENTS_CONTENT_SELECTOR):
+                    self.logger.info("Application requirements already loaded")
+                else:
+                    self._click_application_requirements_tab(driver)
+
+                # Only stop loading once the tab and form scripts have done their work
+                self._stop_loading_subresources(driver)
+                return driver.page_source
+
+            except TimeoutException:
+                self.logger.error(f"Timeout loading scholarship page: {url}")
+                return None
+
+    async def extract_scholarship_details(self, url: str, title: str) -> Optional[Dict]:
         """Extract detailed scholarship information from individual page"""
         try:
             self.logger.info(f"Extracting details for: {title}")
-            page_source = self.get_scholarship_details_page(url)
+            tree = await self.get_scholarship_details_page(url)
 
-            if not page_source:
+            if not tree:
                 return None
 
-            soup = BeautifulSoup(page_source, 'html.parser')
-
             scholarship_data = {
                 'title': title,
                 'url': url,
@@ -263,15 +785,7 @@ class DAADScholarshipScraper:
             }
 
             # Extract content from different sections
-            section_ids = [
-                'ueberblick', 'voraussetzungen', 'prozess',
-                'kontaktberatung', 'bewerbung'
-            ]
-
-            for section_id in section_ids:
-                section = soup.find('div', id=section_id)
-                if section:
-                    self._extract_section_content(section, scholarship_data)
+            self._extract_section_content(tree, scholarship_data)
 
             return scholarship_data
 
@@ -279,45 +793,59 @@ class DAADScholarshipScraper:
             self.logger.error(f"Error extracting details from {url}: {e}")
             return None
 
-    def _extract_section_content(self, section: Tag, scholarship_data: Dict) -> None:
-        """Extract content from a specific section"""
+    def _extract_section_content(self, tree: LexborHTMLParser, scholarship_data: Dict) -> None:
+        """Extract the h3-keyed content of every section in one pass over the page"""
+        h3_details = scholarship_data['h3_details']
         current_key = None
         buffer = []
 
-        for elem in section.children:
-            if isinstance(elem, Tag):
-                if elem.name == 'h3':
-                    # Save previous content block
-                    if current_key and buffer:
-                        scholarship_data['h3_details'][current_key] = '\n'.join(buffer).strip()
+        for elem in tree.css(SECTION_CONTENT_SELECTOR):
+            tag = elem.tag
+            if tag == H3_TAG or tag == 'div':
+                # Save previous content block
+                if current_key and buffer:
+                    h3_details[current_key] = '\n'.join(buffer).strip()
 
-                    current_key = elem.get_text(strip=True)
-                    buffer = []
+                # A new section starts without a heading
+                current_key = elem.text(strip=True) if tag == H3_TAG else None
+                buffer = []
 
-                elif current_key and elem.name in ['p', 'ul', 'ol']:
-                    buffer.append(elem.get_text(separator='\n', strip=True))
+            elif current_key and tag in TEXT_TAGS:
+                buffer.append(elem.text(separator='\n', strip=True))
 
         # Save last content block
         if current_key and buffer:
-            scholarship_data['h3_details'][current_key] = '\n'.join(buffer).strip()
+            h3_details[current_key] = '\n'.join(buffer).strip()
 
-    def scrape_scholarships(self) -> List[Dict]:
-        """Main method to scrape all scholarships"""
+    def scrape_scholarships(self, max_pages: Optional[int] = 1) -> List[Dict]:
+        """
+        Main method to scrape all scholarships.
+
+        Args:
+            max_pages: Number of results pages to scrape; None scrapes them all
+
+        When streaming to `output_file` the returned list stays empty; read the
+        records back with `stream_scholarships()`.
+        """
+        return _run_sync(self.ascrape_scholarships(max_pages))
+
+    async def ascrape_scholarships(self, max_pages: Optional[int] = 1) -> List[Dict]:
+        """Scrape scholarships, overlapping results page fetches with detail page fetches"""
         self.logger.info("Starting DAAD scholarship scraping...")
 
         try:
-            # Get first page to determine total pages
-            page_url = f"{self.search_url}?status=&origin=&subjectGrps=&daad=&intention=&q=&page=1&back=1"
-            page_source = self.get_page_source(page_url)
+            async with self._http_client():
+                # Get first page to determine total pages
+                tree = await self.get_results_page(self._listing_url(1))
 
-            if not page_source:
-                self.logger.error("Failed to load first page")
-                return []
+                if not tree:
+                    self.logger.error("Failed to load first page")
+                    return []
 
-            soup = BeautifulSoup(page_source, 'html.parser')
-            self.extract_scholarship_links(soup)
-            self._process_page_scholarships()
-            time.sleep(2)  # Respectful delay between pages
+                links: asyncio.Queue = asyncio.Queue()
+                producer = asyncio.create_task(self._queue_scholarship_links(tree, max_pages, links))
+                await self._process_page_scholarships(links)
+                await producer
 
             return self.scholarships
 
@@ -325,32 +853,27 @@ class DAADScholarshipScraper:
             self.logger.error(f"Error during scraping: {e}")
             return self.scholarships
 
-    def scrape_first_n_pages(self, n: int = None) -> List[Dict]:
+    def scrape_first_n_pages(self, n: int = None) -> Dict[str, Dict[str, str]]:
         """Scrape first N pages of scholarships for testing"""
+        return _run_sync(self.ascrape_first_n_pages(n))
+
+    async def ascrape_first_n_pages(self, n: int = None) -> Dict[str, Dict[str, str]]:
+        """Collect scholarship links from the first page plus up to N further pages"""
         self.logger.info(f"Starting to scrape first {n} pages...")
 
         try:
-            page_url = f"{self.search_url}?status=&origin=&subjectGrps=&daad=&intention=&q=&page=1&back=1"
-            page_source = self.get_page_source(page_url)
-
-            if not page_source:
-                self.logger.error("Failed to load first page")
-                return []
-
-            soup = BeautifulSoup(page_source, 'html.parser')
-            self.extract_scholarship_links(soup)
-            time.sleep(2)  # Respectful delay between pages
-
-            count = 0
-            while not n or count < n:
-                if self.navigate_to_next_page():
-                    page_source = self.driver.page_source
-                    soup = BeautifulSoup(page_source, 'html.parser')
-                    self.extract_scholarship_links(soup)
-                    time.sleep(2)
-                    count += 1 # Respectful delay between pages
-                else:
-                    break
+            async with self._http_client():
+                tree = await self.get_results_page(self._listing_url(1))
+
+                if not tree:
+                    self.logger.error("Failed to load first page")
+                    return {}
+
+                self.extract_scholarship_links(tree)
+                pages = [page async for page in self._iter_listing_pages(tree, n + 1 if n else None)]
+                # Pages arrive in completion order; record their links in page order
+                for _, page_tree in sorted(pages, key=lambda page: page[0]):
+                    self.extract_scholarship_links(page_tree)
 
             return self.scholarship_links
 
@@ -358,42 +881,98 @@ class DAADScholarshipScraper:
             self.logger.error(f"Error during scraping: {e}")
             return self.scholarship_links
 
+    async def _queue_scholarship_links(self, first_page: LexborHTMLParser,
+                                       max_pages: Optional[int], links: asyncio.Queue) -> None:
+        """Queue new scholarship links from every results page as soon as the page arrives"""
+        seen = set()
 
-    def _process_page_scholarships(self) -> None:
-        """Process scholarships from a single page"""
-        scholarship_links = list(self.scholarship_links.values())
-        self.logger.info(f"Found {len(scholarship_links)} scholarships on page")
+        def queue_page(page: int, tree: LexborHTMLParser) -> None:
+            for position, link_data in enumerate(self.extract_scholarship_links(tree)):
+                if link_data['url'] not in seen:
+                    seen.add(link_data['url'])
+                    # Results are sorted on (page, position) once all are extracted
+                    links.put_nowait(((page, position), link_data))
 
-        for i, link_data in enumerate(scholarship_links, 1):
-            self.logger.info(f"Processing scholarship {i}/{len(scholarship_links)}: {link_data['title']}")
+        try:
+            queue_page(1, first_page)
+            async for page, tree in self._iter_listing_pages(first_page, max_pages):
+                queue_page(page, tree)
+            self.logger.info(f"Found {len(seen)} scholarships")
+        finally:
+            # One stop marker per detail worker
+            for _ in range(self.concurrency):
+                links.put_nowait(None)
+
+    async def _process_page_scholarships(self, links: asyncio.Queue) -> None:
+        """Process queued scholarships with `concurrency` detail workers"""
+        results = {}
+
+        async def worker() -> None:
+            while True:
+                item = await links.get()
+                if item is None:
+                    return
+
+                key, link_data = item
+                self.logger.info(f"Processing scholarship {key[1] + 1} of page {key[0]}: {link_data['title']}")
+                scholarship_details = await self.extract_scholarship_details(
+                    link_data['url'], link_data['title']
+                )
 
-            scholarship_details = self.extract_scholarship_details(
-                link_data['url'], link_data['title']
-            )
+                if not scholarship_details:
+                    self.logger.warning(f"Failed to extract: {link_data['title']}")
+                    continue
 
-            if scholarship_details:
-                self.scholarships.append(scholarship_details)
                 self.logger.info(f"Successfully extracted: {scholarship_details['title']}")
-            else:
-                self.logger.warning(f"Failed to extract: {link_data['title']}")
+                if self._out:
+                    # Persist right away so nothing is held in memory or lost on interrupt
+                    self._out.write(orjson.dumps(scholarship_details) + b"\n")
+                else:
+                    results[key] = scholarship_details
 
-            time.sleep(1)  # Respectful delay
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        # Keep results page order regardless of page and detail completion order
+        self.scholarships.extend(results[key] for key in sorted(results))
+
+    def stream_scholarships(self) -> Iterator[Dict]:
+        """Yield the scholarships written to `output_file` so far, or the in-memory ones if not streaming"""
+        if not self._streamed:
+            yield from self.scholarships
+            return
+
+        if self._out:
+            self._out.flush()
+
+        with open(self.output_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
 
     def save_to_json(self, filename: str = 'daad_scholarships.json') -> None:
-        """Save scholarships to JSON file"""
+        """Save scholarships to JSON file, converting the JSON Lines output if streaming"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.scholarships, f, indent=2, ensure_ascii=False)
-            self.logger.info(f"Saved {len(self.scholarships)} scholarships to {filename}")
+            scholarships = list(self.stream_scholarships()) if self._streamed else self.scholarships
+            # orjson writes UTF-8 without escaping, like ensure_ascii=False
+            Path(filename).write_bytes(orjson.dumps(scholarships, option=orjson.OPT_INDENT_2))
+            self.logger.info(f"Saved {len(scholarships)} scholarships to {filename}")
         except Exception as e:
             self.logger.error(f"Error saving to JSON: {e}")
 
+    def reset(self) -> None:
+        """Forget results from a previous scrape so the instance can be reused"""
+        self.scholarships = []
+        self.scholarship_links = {}
+
     def close(self) -> None:
-        """Close the webdriver"""
-        if self.driver:
-            self.driver.quit()
+        """Close the JSON Lines output; pooled drivers are shut down with their pool"""
+        if self._out:
+            self._out.close()
+            self._out = None
 
     def __enter__(self):
+        if self.output_file:
+            self._out = open(self.output_file, 'ab')
+            self._streamed = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -419,7 +998,7 @@ def main():
             # Display sample scholarship
             if scraper.scholarships:
                 print("\nSample scholarship:")
-                print(json.dumps(scraper.scholarships[0], indent=2))
+                print(orjson.dumps(scraper.scholarships[0], option=orjson.OPT_INDENT_2).decode())
 
         except KeyboardInterrupt:
             print("\nScraping interrupted by user")
@@ -1,13 +1,70 @@
-from src.research_daad.tools.daad_scraper import DAADScholarshipScraper
+import queue
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+import orjson
+
+from src.research_daad.tools.daad_scraper import DAADScholarshipScraper, get_driver_pool
 from crewai.tools import tool
 
 
+# Scrapers idle between tool calls; they share the process-wide Chrome pool
+SCRAPER_POOL_SIZE = 4
+_idle_scrapers: "queue.Queue[DAADScholarshipScraper]" = queue.Queue(maxsize=SCRAPER_POOL_SIZE)
+
+
+@contextmanager
+def _borrow_scraper() -> Iterator[DAADScholarshipScraper]:
+    """Reuse an idle headless scraper, creating one only when none is free"""
+    try:
+        scraper = _idle_scrapers.get_nowait()
+    except queue.Empty:
+        scraper = DAADScholarshipScraper(headless=True)
+
+    try:
+        scraper.reset()
+        yield scraper
+    finally:
+        try:
+            _idle_scrapers.put_nowait(scraper)
+        except queue.Full:
+            scraper.close()
+
+
+def prewarm_scraper() -> None:
+    """Start a headless Chrome and a pooled scraper in the background before the first tool call"""
+
+    def warm() -> None:
+        try:
+            get_driver_pool(headless=True).prewarm()
+            with _borrow_scraper():
+                pass
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Scraper prewarm failed: {e}")
+
+    # Not a daemon: exit waits for a launch in progress, so the new driver is
+    # tracked by the pool and quit by its atexit hook instead of being orphaned
+    threading.Thread(target=warm, name="daad-scraper-prewarm").start()
+
+
+@atexit.register
+def _close_scrapers() -> None:
+    """Close pooled scrapers at interpreter exit"""
+    while not _idle_scrapers.empty():
+        _idle_scrapers.get_nowait().close()
+
+
 @tool("scrape_daad_scholarships")
 def scrape_daad_scholarships() -> str:
     """Scrapes all active scholarships from the DAAD database"""
 
-    scraper = DAADScholarshipScraper(headless=True)
-    all_scholarships = scraper.scrape_scholarships()
+    with _borrow_scraper() as scraper:
+        all_scholarships = scraper.scrape_scholarships()
     if not all_scholarships:
         return "No scholarships found."
-    return str(all_scholarships)
+    # Compact UTF-8 JSON: fewer tokens than repr and easier for the agent to parse
+    return orjson.dumps(all_scholarships).decode()
+
@@ -1,15 +1,68 @@
 """Environment configuration module with type-safe getters and validation."""
 
 import os
-from typing import Optional
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
+# Set once .env has been loaded; child processes inherit it and skip the file
+_ENV_LOADED_SENTINEL = "SOPHOS_ENV_LOADED"
+
 # Load variables from .env if present (doesn't override existing env by default)
-load_dotenv(override=False)
+if not os.environ.get(_ENV_LOADED_SENTINEL):
+    load_dotenv(override=False)
+    os.environ[_ENV_LOADED_SENTINEL] = "1"
+
+# Normalized boolean spellings mapped to their value in a single lookup table
+_BOOL_MAP = {
+    **{k: True for k in ("1", "true", "t", "yes", "y", "on")},
+    **{k: False for k in ("0", "false", "f", "no", "n", "off")},
+}
+
+# Parsed values keyed by (type name, variable); None means "use the default"
+_cache: Dict[Tuple[str, str], Any] = {}
+
+
+def _cached(typename: str, key: str, parse: Callable[[Optional[str]], Any]) -> Any:
+    """Parse an environment variable once per type and reuse the result."""
+    cache_key = (typename, key)
+    try:
+        return _cache[cache_key]
+    except KeyError:
+        value = _cache[cache_key] = parse(os.getenv(key))
+        return value
+
+
+def reset_cache() -> None:
+    """Forget every parsed value so the next read goes back to os.environ."""
+    _cache.clear()
+
+
+def _parse_bool(val: Optional[str]) -> Optional[bool]:
+    if val is None:
+        return None
+
+    return _BOOL_MAP.get(val.strip().lower())
+
+
+def _parse_str(val: Optional[str]) -> Optional[str]:
+    return val if val is not None and val.strip() else None
+
+
+def _parse_number(pattern: "re.Pattern[str]", cast: Callable[[str], Any]) -> Callable[[Optional[str]], Any]:
+    def parse(val: Optional[str]) -> Any:
+        val = (val or "").strip()
+        # Validate up front so malformed values never raise inside the cast
+        return cast(val) if pattern.fullmatch(val) else None
+    return parse
+
+
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
 
-# Constants for boolean parsing
-_TRUTHY_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
-_FALSY_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+_parse_int = _parse_number(_INT_RE, int)
+_parse_float = _parse_number(_FLOAT_RE, float)
 
 
 def get_bool(key: str, default: bool = False) -> bool:
@@ -22,16 +75,8 @@ def get_bool(key: str, default: bool = False) -> bool:
     Returns:
         Boolean value parsed from environment variable
     """
-    val = os.getenv(key)
-    if val is None:
-        return default
-
-    normalized = val.strip().lower()
-    if normalized in _TRUTHY_VALUES:
-        return True
-    if normalized in _FALSY_VALUES:
-        return False
-    return default
+    val = _cached("bool", key, _parse_bool)
+    return default if val is None else val
 
 
 def get_str(key: str, default: Optional[str] = None) -> Optional[str]:
@@ -44,8 +89,8 @@ def get_str(key: str, default: Optional[str] = None) -> Optional[str]:
     Returns:
         String value or default if not found/empty
     """
-    val = os.getenv(key)
-    return val if val is not None and val.strip() else default
+    val = _cached("str", key, _parse_str)
+    return default if val is None else val
 
 
 def get_int(key: str, default: int) -> int:
@@ -58,14 +103,8 @@ def get_int(key: str, default: int) -> int:
     Returns:
         Integer value parsed from environment variable
     """
-    val = os.getenv(key, "").strip()
-    if not val:
-        return default
-
-    try:
-        return int(val)
-    except ValueError:
-        return default
+    val = _cached("int", key, _parse_int)
+    return default if val is None else val
 
 
 def get_float(key: str, default: float) -> float:
@@ -78,44 +117,82 @@ def get_float(key: str, default: float) -> float:
     Returns:
         Float value parsed from environment variable
     """
-    val = os.getenv(key, "").strip()
-    if not val:
-        return default
+    val = _cached("float", key, _parse_float)
+    return default if val is None else val
 
-    try:
-        return float(val)
-    except ValueError:
-        return default
 
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings, read from the environment once at import."""
+
+    # LLM Configuration
+    default_llm_provider: str
+    default_llm_model: Optional[str]
+    llm_temperature: float
+    llm_max_tokens: int
+    llm_cache: bool
+
+    # Maximum number of crews kicked off concurrently
+    max_concurrency: int
+
+    # API Keys
+    openrouter_api_key: Optional[str]
+
+    # Scraper Configuration
+    html_cache_dir: Optional[str]
+    prewarm_browser: bool
 
-# LLM Configuration
-DEFAULT_LLM_PROVIDER = (get_str("DEFAULT_LLM_PROVIDER", "openai") or "openai").lower()
-DEFAULT_LLM_MODEL = get_str("DEFAULT_LLM_MODEL")
-LLM_TEMPERATURE = get_float("LLM_TEMPERATURE", 0.1)
-LLM_MAX_TOKENS = get_int("LLM_MAX_TOKENS", 3000)
+    # Docker and Browser Configuration
+    running_in_docker: bool
+    chrome_bin: Optional[str]
+    chromedriver: Optional[str]
 
-# API Keys
-OPENROUTER_API_KEY = get_str("OPENROUTER_API_KEY")
 
-# Docker and Browser Configuration
-RUNNING_IN_DOCKER = get_bool("RUNNING_IN_DOCKER", False)
-CHROME_BIN = get_str("CHROME_BIN", "")
-CHROMEDRIVER = get_str("CHROMEDRIVER", "")
+def load_settings() -> Settings:
+    """Build the settings from the current environment.
+
+    Returns:
+        Settings populated from environment variables and their defaults
+    """
+    return Settings(
+        default_llm_provider=(get_str("DEFAULT_LLM_PROVIDER", "openai") or "openai").lower(),
+        default_llm_model=get_str("DEFAULT_LLM_MODEL"),
+        llm_temperature=get_float("LLM_TEMPERATURE", 0.1),
+        llm_max_tokens=get_int("LLM_MAX_TOKENS", 3000),
+        llm_cache=get_bool("LLM_CACHE", False),
+        # 0 would make every kickoff wait forever and a negative value is invalid
+        max_concurrency=max(1, get_int("MAX_CONCURRENCY", 4)),
+        openrouter_api_key=get_str("OPENROUTER_API_KEY"),
+        html_cache_dir=get_str("HTML_CACHE_DIR", "/tmp/daad_html"),
+        prewarm_browser=get_bool("PREWARM_BROWSER", False),
+        running_in_docker=get_bool("RUNNING_IN_DOCKER", False),
+        chrome_bin=get_str("CHROME_BIN", ""),
+        chromedriver=get_str("CHROMEDRIVER", ""),
+    )
+
+
+settings = load_settings()
+
+
+_docker_config_validated = False
 
 
 def validate_docker_config() -> None:
     """Validate Docker-specific configuration requirements.
 
+    The settings are read once at import, so a successful check is not repeated.
+
     Raises:
         EnvironmentError: If required Docker environment variables are missing
     """
-    if not RUNNING_IN_DOCKER:
+    global _docker_config_validated
+    if _docker_config_validated or not settings.running_in_docker:
         return
 
     missing = []
-    if not CHROME_BIN:
+    if not settings.chrome_bin:
         missing.append("CHROME_BIN")
-    if not CHROMEDRIVER:
+    if not settings.chromedriver:
         missing.append("CHROMEDRIVER")
 
     if missing:
@@ -123,6 +200,8 @@ def validate_docker_config() -> None:
             f"Missing required environment variables when RUNNING_IN_DOCKER=true: {', '.join(missing)}"
         )
 
+    _docker_config_validated = True
+
 
 # Validate configuration on import
 validate_docker_config()
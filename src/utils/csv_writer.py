@@ -0,0 +1,76 @@
+"""Write cleaned scholarship records to CSV without routing them through an LLM."""
+
+import re
+import csv
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+import orjson
+
+# Rows go through a 1 MiB buffer instead of being joined into one string first
+CSV_BUFFER_SIZE = 1 << 20
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+_DECODER = json.JSONDecoder()
+_FENCED_BLOCK = re.compile(r"```(?:json)?\s*(.*?)```", re.S)
+
+
+def parse_json_records(text: str) -> Optional[List[Dict[str, Any]]]:
+    """Extract the JSON list of records from an agent's reply.
+
+    Fenced code blocks are tried first, then every `[` in the text, each
+    decoded with `raw_decode` so brackets in surrounding prose don't matter.
+
+    Args:
+        text: Raw agent output, possibly wrapped in prose or a code fence
+
+    Returns:
+        The list of record dicts, or None if no JSON list of objects was found
+    """
+    candidates = [match.group(1) for match in _FENCED_BLOCK.finditer(text)] + [text]
+    for candidate in candidates:
+        start = candidate.find('[')
+        while start != -1:
+            try:
+                value, _ = _DECODER.raw_decode(candidate, start)
+            except ValueError:
+                value = None
+
+            if isinstance(value, list) and value and all(isinstance(record, dict) for record in value):
+                return value
+            start = candidate.find('[', start + 1)
+
+    return None
+
+
+def _cell(value: Any) -> Any:
+    """Keep scalars as they are and encode nested values as JSON rather than repr."""
+    if value is None or isinstance(value, _SCALAR_TYPES):
+        return value
+    return orjson.dumps(value).decode()
+
+
+def write_records_csv(records: List[Dict[str, Any]], path: str) -> int:
+    """Stream records to a CSV file through a large write buffer.
+
+    Args:
+        records: Row dicts; columns are the union of their keys in first-seen order
+        path: Destination CSV file, created along with its directory
+
+    Returns:
+        Number of rows written
+    """
+    fieldnames = list(dict.fromkeys(key for record in records for key in record))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    rows: Iterable[Dict[str, Any]] = (
+        {key: _cell(value) for key, value in record.items()} for record in records
+    )
+    with open(path, 'w', buffering=CSV_BUFFER_SIZE, newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return len(records)
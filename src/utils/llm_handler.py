@@ -1,13 +1,50 @@
 import os
-from typing import Dict, Any
-from langchain_openai import OpenAI, ChatOpenAI
-from langchain.llms import Ollama
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import GoogleGenerativeAI
+import functools
+from types import MappingProxyType
+from typing import Dict, Any, List, Sequence
 from langchain.schema.language_model import BaseLanguageModel
-from dotenv import load_dotenv
+from langchain_core.language_models import LanguageModelInput
+# Loads .env once per process tree before provider clients read their API keys
+import src.utils.config  # noqa: F401
 
-load_dotenv()
+
+@functools.lru_cache(maxsize=1)
+def enable_litellm_cache(ttl: float = 3600) -> None:
+    """
+    Turn on litellm's in-process response cache for every litellm call in the process.
+
+    CrewAI agents convert a LangChain model into a litellm-backed `crewai.LLM`
+    (see `create_llm`), so this is the cache crew runs actually consult. It is
+    global, so only entrypoints should enable it.
+    """
+    import litellm
+    litellm.cache = litellm.Cache(type="local", ttl=ttl)
+
+
+# Provider integrations are imported on first use so a process only pays for
+# the provider it actually runs, and the others stay optional dependencies
+@functools.lru_cache(maxsize=None)
+def _chat_openai_class():
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI
+
+
+@functools.lru_cache(maxsize=None)
+def _chat_anthropic_class():
+    from langchain_anthropic import ChatAnthropic
+    return ChatAnthropic
+
+
+@functools.lru_cache(maxsize=None)
+def _google_generative_ai_class():
+    from langchain_google_genai import GoogleGenerativeAI
+    return GoogleGenerativeAI
+
+
+@functools.lru_cache(maxsize=None)
+def _ollama_class():
+    from langchain.llms import Ollama
+    return Ollama
 
 
 class LLMHandler:
@@ -39,8 +76,8 @@ class LLMHandler:
     # llama_handler = LLMHandler.from_config(config)
     """
 
-    # Default configurations for different providers
-    DEFAULT_CONFIGS = {
+    # Default configurations for different providers (read-only, merged per handler)
+    DEFAULT_CONFIGS = MappingProxyType({
         'openai': {
             'temperature': 0.1,
             'max_tokens': 3000,
@@ -70,14 +107,14 @@ class LLMHandler:
             'num_predict': 3000,
             'top_p': 1
         }
-    }
+    })
 
-    # Available models for each provider
+    # Available models for each provider (frozensets for O(1) validation)
     AVAILABLE_MODELS = {
-        'openai': [
+        'openai': frozenset({
             'gpt-4o', 'gpt-4o-mini', 'gpt-4-turbo', 'gpt-4',
             'gpt-3.5-turbo', 'gpt-3.5-turbo-16k'
-        ],
+        }),
         # 'openrouter': [
         #     # OpenAI models via OpenRouter
         #     'openai/gpt-4o', 'openai/gpt-4o-mini',
@@ -92,18 +129,18 @@ class LLMHandler:
         #     # Other popular models
         #     'deepseek/deepseek-chat',
         # ],
-        'anthropic': [
+        'anthropic': frozenset({
             'claude-3-5-sonnet-20241022', 'claude-3-opus-20240229',
             'claude-3-sonnet-20240229', 'claude-3-haiku-20240307'
-        ],
-        'google': [
+        }),
+        'google': frozenset({
             'gemini-pro', 'gemini-pro-vision', 'gemini-1.5-pro', 'gemini-2.0-flash',
             'gemini-1.5-flash', 'gemini-2.0-flash-lite'
-        ],
-        'ollama': [
+        }),
+        'ollama': frozenset({
             'llama3', 'llama3.1', 'llama3.2', 'mistral', 'codellama',
             'dolphin-mistral', 'neural-chat', 'starling-lm'
-        ]
+        })
     }
 
     def __init__(self, provider: str = 'openai', model: str = None, **kwargs):
@@ -146,9 +183,7 @@ class LLMHandler:
 
     def _merge_configs(self) -> Dict[str, Any]:
         """Merge default config with user-provided config."""
-        base_config = self.DEFAULT_CONFIGS[self.provider].copy()
-        base_config.update(self.config)
-        return base_config
+        return {**self.DEFAULT_CONFIGS[self.provider], **self.config}
 
     def get_llm(self) -> BaseLanguageModel:
         """
@@ -172,9 +207,23 @@ class LLMHandler:
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
 
-    def _create_openai_llm(self, config: Dict[str, Any]) -> ChatOpenAI:
+    async def abatch(self, prompts: Sequence[LanguageModelInput], concurrency: int = 10) -> List[Any]:
+        """
+        Invoke the configured LLM on several prompts concurrently.
+
+        Args:
+            prompts: Prompts to send, one request each
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List[Any]: One response per prompt, in the order given
+        """
+        llm = self.get_llm()
+        return await llm.abatch(list(prompts), config={'max_concurrency': concurrency})
+
+    def _create_openai_llm(self, config: Dict[str, Any]) -> BaseLanguageModel:
         """Create OpenAI LLM instance."""
-        return ChatOpenAI(
+        return _chat_openai_class()(
             model_name=self.model,
             **config
         )
@@ -185,28 +234,28 @@ class LLMHandler:
     #     llm = OpenAI(
     #         model_name="openrouter/{self.model}",
     #         openai_api_base="https://openrouter.ai/api/v1",
-    #         openai_api_key=CONFIG.OPENROUTER_API_KEY,
+    #         openai_api_key=settings.openrouter_api_key,
     #         **config
     #     )
     #     return llm
 
-    def _create_anthropic_llm(self, config: Dict[str, Any]) -> ChatAnthropic:
+    def _create_anthropic_llm(self, config: Dict[str, Any]) -> BaseLanguageModel:
         """Create Anthropic LLM instance."""
-        return ChatAnthropic(
+        return _chat_anthropic_class()(
             model=self.model,
             **config
         )
 
-    def _create_google_llm(self, config: Dict[str, Any]) -> GoogleGenerativeAI:
+    def _create_google_llm(self, config: Dict[str, Any]) -> BaseLanguageModel:
         """Create Google LLM instance."""
-        return GoogleGenerativeAI(
+        return _google_generative_ai_class()(
             model=self.model,
             **config
         )
 
-    def _create_ollama_llm(self, config: Dict[str, Any]) -> Ollama:
+    def _create_ollama_llm(self, config: Dict[str, Any]) -> BaseLanguageModel:
         """Create Ollama LLM instance."""
-        return Ollama(
+        return _ollama_class()(
             model=self.model,
             **config
         )